@@ -0,0 +1 @@
+"""Бенчмарки лабораторных работ: python -m bench.run"""
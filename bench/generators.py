@@ -0,0 +1,97 @@
+"""
+Генераторы входных данных для бенчмарков.
+Все генераторы детерминированы: принимают random.Random с заданным seed.
+Графы возвращаются как (n, edges), где edges - список кортежей (u, v) или (u, v, w).
+"""
+
+import math
+
+# Алфавит с неравномерными частотами - чтобы коды Фано были разной длины
+ALPHABET = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяabcdefghijklmnopqrstuvwxyz"
+
+
+def text_corpus(size, rng):
+    """Текст длины size из слов со ступенчатым (zipf-подобным) распределением букв"""
+    weights = [1.0 / (i + 1) for i in range(len(ALPHABET))]
+    chunks = []
+    length = 0
+    while length < size:
+        word = "".join(rng.choices(ALPHABET, weights, k=rng.randint(1, 10)))
+        sep = "\n" if rng.random() < 0.05 else " "
+        chunks.append(word + sep)
+        length += len(word) + 1
+    return "".join(chunks)[:size]
+
+
+def weighted_graph(n, edge_count, rng, max_weight=100):
+    """Ориентированный граф с положительными весами (без отрицательных циклов)"""
+    edge_count = min(edge_count, n * (n - 1))
+    edges = {}
+    while len(edges) < edge_count:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u != v and (u, v) not in edges:
+            edges[(u, v)] = rng.randint(1, max_weight)
+    return n, [(u + 1, v + 1, w) for (u, v), w in edges.items()]  # lab2 нумерует вершины с 1
+
+
+def dense_weighted_graph(n, rng):
+    return weighted_graph(n, n * (n - 1), rng)
+
+
+def sparse_weighted_graph(n, rng, degree=4):
+    return weighted_graph(n, n * degree, rng)
+
+
+def random_tree(n, rng):
+    """Случайное дерево: каждая вершина v > 0 подвешивается к случайной вершине < v"""
+    order = list(range(n))
+    rng.shuffle(order)
+    return n, [(order[rng.randrange(v)], order[v]) for v in range(1, n)]
+
+
+def near_tree(n, rng, extra=1):
+    """Дерево плюс extra лишних рёбер (появляются циклы)"""
+    n, edges = random_tree(n, rng)
+    present = set(edges)
+    present.update((v, u) for u, v in edges)
+    extra = min(extra, n * (n - 1) // 2 - len(edges))
+    while extra > 0:
+        u = rng.randrange(n)
+        v = rng.randrange(n)
+        if u != v and (u, v) not in present:
+            present.add((u, v))
+            present.add((v, u))
+            edges.append((u, v))
+            extra -= 1
+    return n, edges
+
+
+def gnp(n, p, rng):
+    """Случайный граф Эрдёша-Реньи G(n, p).
+    Пропускаем отсутствующие рёбра геометрическими скачками (Batagelj-Brandes),
+    поэтому разреженные графы строятся за O(n + m), а не за O(n^2)."""
+    if p <= 0:
+        return n, []
+    if p >= 1:
+        return n, [(u, v) for v in range(n) for u in range(v)]
+
+    edges = []
+    log_q = math.log(1.0 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            edges.append((w, v))
+    return n, edges
+
+
+def write_edge_list(filename, n, edges):
+    """Сохраняет граф в формате входных файлов лабораторных (n, затем по ребру в строке)"""
+    with open(filename, "w") as f:
+        f.write(f"{n}\n")
+        for edge in edges:
+            f.write(" ".join(map(str, edge)) + "\n")
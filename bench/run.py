@@ -0,0 +1,176 @@
+"""
+Бенчмарки всех четырёх лабораторных: время работы алгоритмов на растущих входах.
+Результаты печатаются таблицей и сохраняются в JSON, чтобы сравнивать версии.
+
+Использование:
+    python -m bench.run [-o results.json] [--only fano,apsp,tree,mis] [--quick]
+                        [--repeat N] [--seed S] [--compare old.json]
+(из корня репозитория, чтобы были видны пакеты bench и diskretka)
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+import platform
+from contextlib import redirect_stdout
+
+from bench import generators
+from diskretka import labs
+
+fano = labs.load("fano")
+apsp = labs.load("apsp")
+tree = labs.load("tree")
+mis = labs.load("mis")
+
+
+def measure(func, setup, repeat):
+    """Запускает setup() -> args и func(*args) repeat раз, возвращает времена func"""
+    times = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            args = setup()
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def build_graph(module, n, edges):
+    graph = module.Graph(n)
+    add = graph.addEdge if hasattr(graph, "addEdge") else graph.add_edge
+    for edge in edges:
+        add(*edge)
+    return graph
+
+
+# ---------- Лабораторная 1: Фано ----------
+
+def fano_build(text):
+    fano.codes_dict = {}
+    fano.probabilities_list = fano.calculate_frequencies(text)
+    fano.Fano(0, len(fano.probabilities_list) - 1, 0)
+    fano.reverse_codes_dict = {v: k for k, v in fano.codes_dict.items()}
+
+
+def bench_fano(sizes, rng, repeat):
+    for size in sizes:
+        text = generators.text_corpus(size, rng)
+        yield "fano.Fano", size, measure(fano_build, lambda: (text,), repeat)
+
+        fano_build(text)
+        yield "fano.encode_text", size, measure(fano.encode_text, lambda: (text,), repeat)
+
+        bits = fano.encode_text(text)
+        yield "fano.decode_text", size, measure(fano.decode_text, lambda: (bits,), repeat)
+
+
+# ---------- Лабораторная 2: Флойд-Уоршелл ----------
+
+def bench_apsp(sizes, rng, repeat):
+    for n in sizes:
+        for kind, make in (("dense", generators.dense_weighted_graph),
+                           ("sparse", generators.sparse_weighted_graph)):
+            graph = build_graph(apsp, *make(n, rng))
+            yield f"apsp.floydWarshall.{kind}", n, measure(apsp.floydWarshall, lambda: (graph,), repeat)
+
+
+# ---------- Лабораторная 3: проверка дерева ----------
+
+def bench_tree(sizes, rng, repeat):
+    for n in sizes:
+        tree_graph = build_graph(tree, *generators.random_tree(n, rng))
+        near_graph = build_graph(tree, *generators.near_tree(n, rng))
+        gnp_graph = build_graph(tree, *generators.gnp(n, 2.0 / n, rng))
+
+        yield "tree.count_components.tree", n, measure(tree.count_components, lambda: (tree_graph,), repeat)
+        yield "tree.count_components.gnp", n, measure(tree.count_components, lambda: (gnp_graph,), repeat)
+        yield "tree.find_cycle.tree", n, measure(tree.find_cycle, lambda: (tree_graph,), repeat)
+        yield "tree.find_cycle.near_tree", n, measure(tree.find_cycle, lambda: (near_graph,), repeat)
+
+
+# ---------- Лабораторная 4: MIS ----------
+
+def bench_mis(sizes, rng, repeat):
+    for n in sizes:
+        graph = build_graph(mis, *generators.gnp(n, 0.3, rng))
+        yield "mis.findMIS.gnp", n, measure(mis.findMIS, lambda: (graph,), repeat)
+
+
+BENCHES = {
+    "fano": (bench_fano, [10_000, 100_000, 1_000_000]),
+    "apsp": (bench_apsp, [50, 100, 200]),
+    "tree": (bench_tree, [10_000, 100_000, 500_000]),
+    "mis": (bench_mis, [60, 80, 100]),
+}
+
+
+def compare(results, old_filename):
+    """Печатает отношение времени к сохранённому прогону (> 1 - стало медленнее)"""
+    with open(old_filename, encoding="utf-8") as f:
+        old = {(r["bench"], r["size"]): r["best"] for r in json.load(f)["results"]}
+
+    print(f"\nСравнение с {old_filename}:")
+    for r in results:
+        key = (r["bench"], r["size"])
+        if key in old and old[key] > 0:
+            ratio = r["best"] / old[key]
+            mark = "  <-- медленнее" if ratio > 1.1 else ""
+            print(f"{r['bench']:32} {r['size']:>9}  x{ratio:6.2f}{mark}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарки лабораторных работ")
+    parser.add_argument("-o", "--output", help="файл для результатов в JSON")
+    parser.add_argument("--only", default=",".join(BENCHES),
+                        help="список бенчмарков через запятую: " + ",".join(BENCHES))
+    parser.add_argument("--quick", action="store_true", help="только два наименьших размера")
+    parser.add_argument("--repeat", type=int, default=3, help="число повторов каждого замера")
+    parser.add_argument("--seed", type=int, default=2024, help="seed генераторов")
+    parser.add_argument("--compare", help="JSON предыдущего прогона для сравнения")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",")
+    unknown = [name for name in names if name not in BENCHES]
+    if unknown:
+        parser.error(f"неизвестные бенчмарки: {', '.join(unknown)} (есть: {', '.join(BENCHES)})")
+
+    results = []
+    for name in names:
+        bench, sizes = BENCHES[name]
+        if args.quick:
+            sizes = sizes[:2]
+        rng = random.Random(args.seed)
+        for bench_name, size, times in bench(sizes, rng, args.repeat):
+            result = {
+                "bench": bench_name,
+                "size": size,
+                "best": min(times),
+                "mean": sum(times) / len(times),
+                "runs": len(times),
+            }
+            results.append(result)
+            print(f"{bench_name:32} {size:>9}  best {result['best']:.6f} s  mean {result['mean']:.6f} s")
+
+    if args.output:
+        report = {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Результаты записаны в {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
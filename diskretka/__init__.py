@@ -0,0 +1,12 @@
+"""
+Общий код лабораторных работ по дискретной математике.
+
+Лабораторные можно запускать и как скрипты из их каталогов (python mis.py ...);
+тогда корня репозитория нет в sys.path, и каждая лаба при ImportError один раз
+добавляет его в конец sys.path. Через python -m diskretka пакет уже виден,
+и sys.path не меняется.
+"""
+
+from diskretka import labs as _labs
+
+_labs.install()  # имена diskretka.lab1 ... diskretka.lab4 (см. labs.py)
@@ -0,0 +1,90 @@
+"""
+Единая точка входа для всех лабораторных:
+
+    python -m diskretka fano encode <файл>
+    python -m diskretka fano decode <файл.bin> [--codes <файл.json>]
+    python -m diskretka apsp <входной файл> <выходной файл>
+    python -m diskretka tree <входной файл> <выходной файл> [--basis]
+    python -m diskretka mis <входной файл> [...] [-o output.jsonl] [-j N] [-v]
+
+Модуль нужной лабораторной импортируется только при вызове её подкоманды
+(labs.load), поэтому запуск не тратит время на загрузку остальных.
+Разобранные входные графы кэшируются на диске (см. graphio); --no-cache отключает кэш.
+"""
+
+import os
+import sys
+
+from diskretka import labs
+
+USAGE = """Использование: python -m diskretka [--no-cache] <подкоманда> [аргументы]
+
+Подкоманды:
+  fano encode <файл>                        закодировать файл алгоритмом Фано
+  fano decode <файл.bin> [--codes <json>]   декодировать файл
+  apsp <вход> <выход>                       кратчайшие пути (Флойд-Уоршелл)
+  tree <вход> <выход> [--basis]             проверка, является ли граф деревом
+  mis <вход> [...] [-o файл] [-j N] [-v]    наибольшее независимое множество"""
+
+
+def run_fano(args, cache):
+    fano = labs.load("fano")
+
+    if len(args) == 2 and args[0] == "encode":
+        return fano.encode_file(args[1])
+
+    if args[:1] == ["decode"] and len(args) in (2, 4):
+        bin_file = args[1]
+        codes_file = fano.get_codes_path(bin_file)
+        if len(args) == 4:
+            if args[2] != "--codes":
+                print(USAGE)
+                return False
+            codes_file = args[3]
+        if not os.path.exists(bin_file):
+            print("Файл не найден!")
+            return False
+        return fano.decode_file(bin_file, codes_file)
+
+    print(USAGE)
+    return False
+
+
+def run_apsp(args, cache):
+    return labs.load("apsp").main(args, cache)
+
+
+def run_tree(args, cache):
+    return labs.load("tree").main(args, cache)
+
+
+def run_mis(args, cache):
+    return labs.load("mis").main(args, cache)
+
+
+COMMANDS = {
+    "fano": run_fano,
+    "apsp": run_apsp,
+    "tree": run_tree,
+    "mis": run_mis,
+}
+
+
+def main(argv=None):
+    args = list(sys.argv[1:] if argv is None else argv)
+
+    cache = True
+    if args[:1] == ["--no-cache"]:
+        cache = False
+        args = args[1:]
+
+    if not args or args[0] not in COMMANDS:
+        print(USAGE)
+        return 2
+
+    # обработчики возвращают True при успехе и False при ошибке
+    return 0 if COMMANDS[args[0]](args[1:], cache) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
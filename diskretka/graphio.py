@@ -0,0 +1,102 @@
+"""
+Общее чтение графов из текстовых файлов лабораторных.
+
+Формат: первая строка - число вершин n, далее по ребру в строке:
+"u v" (lab3, lab4) или "u v w" (lab2, взвешенный граф).
+
+read_edge_list возвращает (n, values) - плоский список чисел, где каждые
+width чисел образуют одно ребро. Испорченный файл (не числа, неполное ребро,
+номер вершины вне диапазона) даёт ValueError. С cache=True разобранный граф сохраняется
+в двоичном виде, ключ - SHA-256 содержимого файла, поэтому повторный запуск
+на том же файле не разбирает текст заново.
+Каталог кэша: $DISKRETKA_CACHE_DIR или ~/.cache/diskretka.
+"""
+
+import os
+import struct
+import hashlib
+from array import array
+
+MAGIC = b"DKG1"
+HEADER = struct.Struct("<4sqqB")  # магия, n, число значений, width
+
+
+def cache_dir():
+    return os.environ.get("DISKRETKA_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "diskretka")
+
+
+def parse_edge_list(raw, width):
+    """Разбор текста (bytes или str) одним проходом: n и плоский список чисел рёбер"""
+    data = raw.split()
+    if not data:
+        raise ValueError("пустой файл: нет числа вершин")
+    values = list(map(int, data[1:]))
+    if len(values) % width != 0:
+        raise ValueError(f"каждое ребро должно состоять из {width} чисел")
+    return int(data[0]), values
+
+
+def _cache_path(raw, width):
+    digest = hashlib.sha256(raw).hexdigest()
+    return os.path.join(cache_dir(), f"{digest}.{width}.dkg")
+
+
+def _load_cached(path, width):
+    try:
+        with open(path, "rb") as f:
+            magic, n, count, cached_width = HEADER.unpack(f.read(HEADER.size))
+            values = array("q")
+            values.frombytes(f.read())
+    except (OSError, struct.error, ValueError):
+        return None
+    if magic != MAGIC or cached_width != width or len(values) != count:
+        return None  # чужой или повреждённый файл - просто разберём текст заново
+    return n, values.tolist()
+
+
+def _store_cached(path, n, values, width):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, n, len(values), width))
+            f.write(array("q", values).tobytes())
+        os.replace(tmp, path)  # атомарно: параллельные запуски не увидят полузаписанный файл
+    except (OSError, OverflowError):
+        pass  # кэш - только ускорение, без него всё работает
+
+
+def check_vertices(n, values, width, first=0):
+    """Номера вершин рёбер должны лежать в [first, first + n - 1] (веса не проверяются)"""
+    if n < 0:
+        raise ValueError(f"отрицательное число вершин: {n}")
+    if not values:
+        return
+    ends = values if width == 2 else values[0::width] + values[1::width]
+    low, high = min(ends), max(ends)
+    if low < first or high > first + n - 1:
+        bad = low if low < first else high
+        raise ValueError(f"номер вершины {bad} вне диапазона {first}..{first + n - 1}")
+
+
+def read_edge_list(filename, weighted=False, cache=False, first=0):
+    """first - номер первой вершины: 0 для lab3/lab4, 1 для lab2"""
+    width = 3 if weighted else 2
+    with open(filename, "rb") as f:
+        raw = f.read()
+
+    cached = None
+    if cache:
+        path = _cache_path(raw, width)
+        cached = _load_cached(path, width)
+
+    if cached is not None:
+        n, values = cached
+    else:
+        n, values = parse_edge_list(raw, width)
+        if cache:
+            _store_cached(path, n, values, width)
+
+    check_vertices(n, values, width, first)
+    return n, values
@@ -0,0 +1,149 @@
+"""
+Счётчики и таймеры для горячих участков алгоритмов.
+
+По умолчанию выключены: функции лабораторных проверяют флаг enabled один раз
+и при выключенной инструментации ничего не считают и не замеряют.
+
+Включение:
+    DISKRETKA_STATS=1          - при выходе напечатать сводку в stderr
+    DISKRETKA_STATS=stats.json - при выходе сохранить сводку в JSON
+или из кода: instrument.enable(), затем summary() / dump_json(filename).
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+from contextlib import contextmanager, nullcontext
+
+enabled = False
+
+counters = {}     # имя -> целое число
+timers = {}       # имя -> [суммарное время, число вызовов]
+series = {}       # имя -> список значений (например, по итерациям k)
+throughputs = {}  # имя -> [объём, время]
+
+_NULL = nullcontext()
+
+
+def enable(flag=True):
+    global enabled
+    enabled = flag
+
+
+def reset():
+    counters.clear()
+    timers.clear()
+    series.clear()
+    throughputs.clear()
+
+
+def count(name, value=1):
+    if enabled:
+        counters[name] = counters.get(name, 0) + value
+
+
+def record(name, values):
+    """Сохраняет ряд значений (последний записанный ряд заменяет предыдущий)"""
+    if enabled:
+        series[name] = list(values)
+
+
+def throughput(name, amount, seconds):
+    """Накопление объёма работы и времени: в сводке выводится объём в секунду"""
+    if enabled:
+        total = throughputs.setdefault(name, [0, 0.0])
+        total[0] += amount
+        total[1] += seconds
+
+
+def add_time(name, seconds, calls=1):
+    """Добавляет к таймеру время, замеренное вручную (когда блок нельзя обернуть в with)"""
+    if enabled:
+        total = timers.setdefault(name, [0.0, 0])
+        total[0] += seconds
+        total[1] += calls
+
+
+@contextmanager
+def _timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_time(name, time.perf_counter() - start)
+
+
+def timer(name):
+    """with instrument.timer("имя"): ... - замер блока (при выключенной инструментации - пустышка)"""
+    if not enabled:
+        return _NULL
+    return _timed(name)
+
+
+def snapshot():
+    """Текущие значения в виде словаря, пригодного для JSON"""
+    return {
+        "counters": dict(counters),
+        "timers": {name: {"seconds": s, "calls": c} for name, (s, c) in timers.items()},
+        "throughputs": {
+            name: {"amount": a, "seconds": s, "per_second": a / s if s > 0 else None}
+            for name, (a, s) in throughputs.items()
+        },
+        "series": {name: list(values) for name, values in series.items()},
+    }
+
+
+def merge(other):
+    """Добавляет снимок snapshot() другого процесса (например, воркера пула) к текущим значениям"""
+    if not enabled or not other:
+        return
+    for name, value in other["counters"].items():
+        counters[name] = counters.get(name, 0) + value
+    for name, timed in other["timers"].items():
+        total = timers.setdefault(name, [0.0, 0])
+        total[0] += timed["seconds"]
+        total[1] += timed["calls"]
+    for name, rate in other["throughputs"].items():
+        total = throughputs.setdefault(name, [0, 0.0])
+        total[0] += rate["amount"]
+        total[1] += rate["seconds"]
+    series.update(other["series"])
+
+
+def summary(file=None):
+    """Печатает сводку в читаемом виде (по умолчанию в stderr)"""
+    file = file or sys.stderr
+    print("=== СТАТИСТИКА ===", file=file)
+    for name, value in sorted(counters.items()):
+        print(f"{name:40} {value}", file=file)
+    for name, (seconds, calls) in sorted(timers.items()):
+        print(f"{name:40} {seconds:.6f} s ({calls} вызовов)", file=file)
+    for name, (amount, seconds) in sorted(throughputs.items()):
+        rate = f"{amount / seconds:.0f}/s" if seconds > 0 else "-"
+        print(f"{name:40} {amount} за {seconds:.6f} s ({rate})", file=file)
+    for name, values in sorted(series.items()):
+        shown = values if len(values) <= 20 else values[:20] + ["..."]
+        print(f"{name:40} {shown}", file=file)
+
+
+def dump_json(filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=2)
+
+
+def _report_at_exit(target):
+    import multiprocessing
+    if multiprocessing.parent_process() is not None:
+        return  # воркер пула: его значения родитель забирает через snapshot()/merge()
+    if target.endswith(".json"):
+        dump_json(target)
+    else:
+        summary()
+
+
+_env = os.environ.get("DISKRETKA_STATS", "")
+if _env and _env != "0":
+    enable()
+    atexit.register(_report_at_exit, _env)
@@ -0,0 +1,41 @@
+"""
+Загрузка модулей лабораторных по имени подкоманды.
+Лабораторные - отдельные скрипты, а не пакеты: модуль грузится по пути к файлу
+под именем diskretka.lab1 ... diskretka.lab4 и только при первом обращении.
+Эти имена разрешает _LabFinder; он ставится при импорте пакета diskretka,
+поэтому по ним модуль находят и процессы пула (pickle ищет функции по имени модуля).
+"""
+
+import os
+import sys
+import importlib
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LABS = {
+    "fano": ("diskretka.lab1", "lab1/fano_code.py"),
+    "apsp": ("diskretka.lab2", "lab2/floyd_warshall.py"),
+    "tree": ("diskretka.lab3", "lab3/main.py"),
+    "mis": ("diskretka.lab4", "lab4/mis.py"),
+}
+
+_PATHS = {module_name: path for module_name, path in LABS.values()}
+
+
+# искатель модулей для sys.meta_path (протоколу достаточно метода find_spec)
+class _LabFinder:
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in _PATHS:
+            return None
+        return importlib.util.spec_from_file_location(fullname, os.path.join(ROOT, _PATHS[fullname]))
+
+
+def install():
+    if not any(isinstance(finder, _LabFinder) for finder in sys.meta_path):
+        sys.meta_path.append(_LabFinder())
+
+
+def load(name):
+    install()
+    return importlib.import_module(LABS[name][0])
@@ -5,7 +5,15 @@
 """
 
 import os
+import sys
 import json
+import time
+
+try:
+    from diskretka import instrument
+except ImportError:  # см. diskretka/__init__.py
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from diskretka import instrument
 
 # Глобальные переменные
 codes_dict = {}           # символ -> код
@@ -61,9 +69,12 @@ def Fano(b, e, k=0):
         return
 
     if e == b:
-        char = probabilities_list[b][0]
-        codes_dict[char] = "0"
-        print(f"Символу '{char}' присвоен код: {codes_dict[char]}")
+        # код листа уже набран на предыдущих уровнях; "0" нужен только
+        # когда в тексте всего один символ и разбиений не было
+        if k == 0:
+            char = probabilities_list[b][0]
+            codes_dict[char] = "0"
+            print(f"Символу '{char}' присвоен код: {codes_dict[char]}")
         return
 
     current_k = k + 1
@@ -103,6 +114,10 @@ def decode_text(encoded_bits):
     """Декодирует битовую строку"""
     global reverse_codes_dict
 
+    stats = instrument.enabled
+    if stats:
+        start = time.perf_counter()
+
     result_text = ""
     current_code = ""
 
@@ -112,6 +127,10 @@ def decode_text(encoded_bits):
             result_text += reverse_codes_dict[current_code]
             current_code = ""
 
+    if stats:
+        instrument.throughput("fano.decode_text.bits", len(encoded_bits), time.perf_counter() - start)
+        instrument.count("fano.decode_text.chars", len(result_text))
+
     if current_code:
         print(f"⚠ Остались нераскодированные биты: {current_code}")
 
@@ -243,6 +262,14 @@ def get_file_path(filename, extension):
     return f"{base}{extension}"
 
 
+def get_codes_path(bin_file):
+    """Таблица кодов для X_encoded.bin - это X_codes.json (так их называет encode_file)"""
+    base = os.path.splitext(bin_file)[0]
+    if base.endswith("_encoded"):
+        base = base[:-len("_encoded")]
+    return f"{base}_codes.json"
+
+
 def show_files_in_directory():
     print("\n📁 ФАЙЛЫ В ПАПКЕ:")
     for f in os.listdir():
@@ -250,9 +277,53 @@ def show_files_in_directory():
             print(f"  {f} ({os.path.getsize(f)} Б)")
 
 
-def main():
+def encode_file(filename):
+    """Кодирует файл: пишет <имя>_encoded.bin и <имя>_codes.json"""
     global codes_dict, reverse_codes_dict, probabilities_list
 
+    text = read_file(filename)
+    if not text:
+        print("Ошибка чтения файла!")
+        return False
+
+    codes_dict = {}
+    reverse_codes_dict = {}
+    probabilities_list = calculate_frequencies(text)
+
+    Fano(0, len(probabilities_list) - 1, 0)
+
+    reverse_codes_dict = {v: k for k, v in codes_dict.items()}
+
+    print_codes_table()
+    encoded = encode_text(text)
+
+    encoded_file = get_file_path(filename, "_encoded.bin")
+    codes_file = get_file_path(filename, "_codes.json")
+
+    write_binary_file(encoded_file, encoded)
+    save_codes_to_file(codes_file)
+    compare_with_original(filename, encoded_file, codes_file)
+    return True
+
+
+def decode_file(bin_file, codes_file):
+    """Декодирует .bin по таблице кодов: пишет <имя>_decoded.txt"""
+    if not load_codes_from_file(codes_file):
+        print("Ошибка загрузки кодов!")
+        return False
+
+    encoded_text = read_binary_file(bin_file)
+    if encoded_text is None:
+        return False
+
+    decoded = decode_text(encoded_text)
+    out = get_file_path(bin_file, "_decoded.txt")
+    write_file(out, decoded)
+    print(f"🎉 Декодировано! Сохранено в {out}")
+    return True
+
+
+def main():
     print("🐍 АЛГОРИТМ ФАНО 🐍")
 
     while True:
@@ -265,28 +336,7 @@ def main():
 
         if choice == '1':
             filename = input("Введите имя файла: ").strip()
-            text = read_file(filename)
-            if not text:
-                print("Ошибка чтения файла!")
-                continue
-
-            codes_dict = {}
-            reverse_codes_dict = {}
-            probabilities_list = calculate_frequencies(text)
-
-            Fano(0, len(probabilities_list) - 1, 0)
-
-            reverse_codes_dict = {v: k for k, v in codes_dict.items()}
-
-            print_codes_table()
-            encoded = encode_text(text)
-
-            encoded_file = get_file_path(filename, "_encoded.bin")
-            codes_file = get_file_path(filename, "_codes.json")
-
-            write_binary_file(encoded_file, encoded)
-            save_codes_to_file(codes_file)
-            compare_with_original(filename, encoded_file, codes_file)
+            encode_file(filename)
 
         elif choice == '2':
             bin_file = input("Введите .bin файл: ").strip()
@@ -294,19 +344,11 @@ def main():
                 print("Файл не найден!")
                 continue
 
-            codes_file = get_file_path(bin_file, "_codes.json")
+            codes_file = get_codes_path(bin_file)
             if not os.path.exists(codes_file):
                 codes_file = input("Введите файл с кодами: ").strip()
 
-            if not load_codes_from_file(codes_file):
-                print("Ошибка загрузки кодов!")
-                continue
-
-            encoded_text = read_binary_file(bin_file)
-            decoded = decode_text(encoded_text)
-            out = get_file_path(bin_file, "_decoded.txt")
-            write_file(out, decoded)
-            print(f"🎉 Декодировано! Сохранено в {out}")
+            decode_file(bin_file, codes_file)
 
         elif choice == '3':
             show_files_in_directory()
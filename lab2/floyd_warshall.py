@@ -1,4 +1,12 @@
+import os
 import sys
+import time
+
+try:
+    from diskretka import graphio, instrument
+except ImportError:  # см. diskretka/__init__.py
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from diskretka import graphio, instrument
 
 class Graph:
     # Конструктор: создаем граф с n вершинами
@@ -17,19 +25,14 @@ class Graph:
         for row in self.weights:
             print(row)
 
-# читаем граф из файла
-def readFromFile(filename):
-    with open(filename, 'r') as file:
-        n = int(file.readline()) # берем количество вершин из файла
-        g = Graph(n)
-
-        for line in file:
-            if line.strip() == "": continue
-            parts = line.split()
-            u = int(parts[0])
-            v = int(parts[1])
-            w = int(parts[2])
-            g.addEdge(u, v, w)
+# читаем граф из файла (строки "u v w")
+def readFromFile(filename, cache=False):
+    n, values = graphio.read_edge_list(filename, weighted=True, cache=cache, first=1)
+    g = Graph(n)
+
+    numbers = iter(values)
+    for u, v, w in zip(numbers, numbers, numbers):
+        g.addEdge(u, v, w)
     return g
 
 def floydWarshall(graph):
@@ -48,8 +51,15 @@ def floydWarshall(graph):
     print("\nНачальная матрица путей P:")
     for rowP in P: print(*rowP)
 
+    stats = instrument.enabled
+    relaxations = []  # число улучшений T[i][j] на каждой итерации k
+
     # 3. Основной цикл алгоритма 
+    loop_time = 0.0  # время самих циклов по i, j - без копирования T для подсчёта релаксаций
     for k in range(n):                # промежуточная вершина k
+        if stats:
+            before = [row[:] for row in T]
+            start = time.perf_counter()
         for i in range(n):            # начальная вершина i
             if k==i or T[i][k] == float('inf'):
                 continue             
@@ -59,6 +69,16 @@ def floydWarshall(graph):
                 if T[i][j] > T[i][k] + T[k][j]:
                     T[i][j] = T[i][k] + T[k][j]
                     P[i][j] = P[k][j]   
+        if stats:
+            loop_time += time.perf_counter() - start
+            # за одну итерацию k каждая T[i][j] улучшается не более одного раза,
+            # поэтому число релаксаций = число изменившихся ячеек
+            relaxations.append(sum(a != b for old, new in zip(before, T) for a, b in zip(old, new)))
+
+    if stats:
+        instrument.add_time("apsp.floydWarshall.main_loop", loop_time)
+        instrument.record("apsp.floydWarshall.relaxations_per_k", relaxations)
+        instrument.count("apsp.floydWarshall.relaxations", sum(relaxations))
 
     # Проверка отрицательного цикла
     for j in range(n):
@@ -132,23 +152,36 @@ def writeResultsToFile(filename, graph, T, P):
 
 
 
-def main():
-    if len(sys.argv) != 3:
+def main(argv=None, cache=False):
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 2:
         print("Использование: python floyd_warshall.py <входной файл> <выходной файл>")
-        return
+        return False
+
+    input_file = args[0]
+    output_file = args[1]
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    try:
+        graph = readFromFile(input_file, cache)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка чтения {input_file}: {e}")
+        return False
 
-    graph = readFromFile(input_file)
     T,P = floydWarshall(graph)
 
-    if T is not None and P is not None:
+    if T is None or P is None:
+        return False  # отрицательный цикл: кратчайших путей нет
+
+    try:
         writeResultsToFile(output_file, graph, T, P)
-        print(f"Результаты записаны в {output_file}")
+    except OSError as e:
+        print(f"Ошибка записи {output_file}: {e}")
+        return False
+    print(f"Результаты записаны в {output_file}")
+    return True
 
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
 
@@ -1,6 +1,13 @@
+import os
 import sys
 from collections import deque
 
+try:
+    from diskretka import graphio, instrument
+except ImportError:  # см. diskretka/__init__.py
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from diskretka import graphio, instrument
+
 class Graph:
     def __init__(self, n):
         self.n = n
@@ -16,16 +23,13 @@ class Graph:
         return self.graph[v]
 
 
-def read_graph_from_file(filename):
-    with open(filename, "r") as file:
-        n = int(file.readline())  # читаем количество вершин
-        graph = Graph(n)  # создаём граф
+def read_graph_from_file(filename, cache=False):
+    n, values = graphio.read_edge_list(filename, cache=cache)  # n и числа рёбер подряд
+    graph = Graph(n)  # создаём граф
 
-        for line in file:
-            parts = line.split() # делим строку по пробелам: ["0", "1"]
-            i = int(parts[0])
-            j = int(parts[1])
-            graph.add_edge(i, j)  # добавляем ребро
+    numbers = iter(values)
+    for i, j in zip(numbers, numbers):
+        graph.add_edge(i, j)  # добавляем ребро
 
     return graph
 
@@ -52,50 +56,107 @@ def count_components(graph):
 
             components.append(comp_vertices)  # двумерный список, где каждый элемент — компонента связности
 
+    if instrument.enabled:
+        # BFS просматривает каждую вершину один раз и весь её список смежности
+        instrument.count("tree.bfs.vertices", graph.n)
+        instrument.count("tree.bfs.edges", sum(len(neigh) for neigh in graph.graph))
+
     return len(components), components
 
-# функция для поиска цикла в графе
+# цвета вершин в DFS
+WHITE, GRAY, BLACK = 0, 1, 2  # не посещена / в стеке обхода / обработана
+
+
+# итеративный DFS, собирающий циклы (first_only=True - остановиться на первом)
+def _dfs_cycles(graph, first_only):
+    n = graph.n
+    adj = graph.graph
+    color = [WHITE] * n          # WHITE / GRAY / BLACK
+    parent = [-1] * n
+    depth = [0] * n              # глубина в дереве обхода = позиция вершины в стеке
+    cursor = [0] * n             # индекс следующего непросмотренного соседа
+    parent_skipped = bytearray(n)  # ребро к родителю уже пропущено (кратные рёбра - тоже цикл)
+    loop_seen = bytearray(n)     # петля u-u лежит в adj[u] дважды, учитываем её один раз
+    stack = [0] * n              # стек обхода: stack[0..top] - путь от корня до текущей вершины
+    cycles = []
+
+    for root in range(n):
+        if color[root] != WHITE:
+            continue  # обходим каждую компоненту (граф может быть несвязным)
+
+        color[root] = GRAY
+        stack[0] = root
+        top = 0
+
+        while top >= 0:
+            u = stack[top]
+            neigh = adj[u]
+            end = len(neigh)
+            i = cursor[u]
+
+            # просматриваем соседей u, пока не найдём непосещённого
+            while i < end:
+                x = neigh[i]
+                i += 1
+                c = color[x]
+                if c == WHITE:
+                    if len(adj[x]) == 1:
+                        # висячая вершина: единственное ребро ведёт в u, цикла через неё нет
+                        color[x] = BLACK
+                        cursor[x] = 1
+                        continue
+                    break
+                if c == GRAY:
+                    # x - предок u в стеке: обратное ребро, если это не ребро к родителю
+                    if x == parent[u] and not parent_skipped[u]:
+                        parent_skipped[u] = 1
+                        continue
+                    if x == u:
+                        loop_seen[u] ^= 1
+                        if not loop_seen[u]:
+                            continue
+                    # путь x -> ... -> u уже лежит в стеке, замыкаем его ребром u - x
+                    cycle = stack[depth[x]:top + 1]
+                    cycle.append(x)
+                    cycles.append(cycle)
+                    if first_only:
+                        cursor[u] = i
+                        _count_dfs(color, cursor)
+                        return cycles
+                # BLACK: ребро к потомку, этот цикл уже найден со стороны потомка
+            else:
+                cursor[u] = i
+                color[u] = BLACK  # все соседи просмотрены - возвращаемся
+                top -= 1
+                continue
+
+            cursor[u] = i
+            color[x] = GRAY  # не посещена - идём глубже
+            parent[x] = u
+            top += 1
+            depth[x] = top
+            stack[top] = x
+
+    _count_dfs(color, cursor)
+    return cycles
+
+
+def _count_dfs(color, cursor):
+    if instrument.enabled:
+        instrument.count("tree.dfs.vertices", len(color) - color.count(WHITE))
+        instrument.count("tree.dfs.edges", sum(cursor))
+
+
+# функция для поиска цикла в графе: возвращает цикл [x, ..., x] или None
 def find_cycle(graph):
-    visited = [False] * graph.n # отмечаем вершины, которые уже посещен
-    parent = [None] * graph.n
-    #stack = []
+    cycles = _dfs_cycles(graph, first_only=True)
+    return cycles[0] if cycles else None
 
-    for v in range(graph.n):
-        if not visited[v]: # делаем обход из каждой непосещенной вершины (тк граф может быть несвязным)
-            stack = [(v, None)] # (текущая вершина, родитель)
-            while stack:
-                u, p = stack.pop()
-                if visited[u]:
-                    continue # если уже обработана - пропускаем
-
-                visited[u] = True
-                parent[u] = p
-
-                # перебираем соседей вершины u
-                for x in graph.neighbors(u):
-                    if not visited[x]:
-                        stack.append((x, u)) # не посещен - идем дальше
-                    else:
-                        if x != p:
-                            # найден цикл: нужно восстановить путь от u до x через parent
-                            cycle = [u]
-                            cur = parent[u]
-                            while cur is not None and cur != x:
-                                cycle.append(cur)
-                                cur = parent[cur]
-
-                                # если cur == x, добавляем x и замыкаем цикл
-                            if cur == x:
-                                cycle.append(x)
-                                # замыкаем цикл, добавив начальную вершину ещё раз
-                                cycle.append(u)
-                                # возвращаем цикл в удобном порядке, например от x до x:
-                                cycle = cycle[::-1]  # разворачиваем, чтобы начинать с x
-                                return cycle
-                            else:
-                                pass
-
-    return None
+
+# фундаментальные циклы (базис циклов) относительно остовного леса DFS:
+# по одному на каждое ребро вне леса, всего q - p + (число компонент)
+def find_cycle_basis(graph):
+    return _dfs_cycles(graph, first_only=False)
 
 
 def is_tree(graph):
@@ -117,7 +178,7 @@ def has_tree_edge_count(graph):
     return graph.edges == graph.n - 1
 
 
-def check_tree_properties(filename, graph):
+def check_tree_properties(filename, graph, basis=False):
     check = chr(0x2714)
     cross = chr(0x2718)
     comp_count, comps = count_components(graph)
@@ -143,6 +204,11 @@ def check_tree_properties(filename, graph):
             f.write(f"Ацикличность: {check} циклов нет\n")
         else:
             f.write(f"Ацикличность: {cross} найден цикл: {cycle}\n")
+            if basis:
+                cycles = find_cycle_basis(graph)
+                f.write(f"Базис циклов ({len(cycles)}):\n")
+                for c in cycles:
+                    f.write(f"  {c}\n")
 
         # 3. Древочисленность
         if edge_condition:
@@ -156,17 +222,31 @@ def check_tree_properties(filename, graph):
         else:
             f.write(f"\nИТОГ: Граф НЕ является деревом {cross}\n")
 
-def main():
-    if len(sys.argv) != 3:
-        print("Использование: python main.py <входной файл> <выходной файл>")
-        return
+def main(argv=None, cache=False):
+    args = list(sys.argv[1:] if argv is None else argv)
+    basis = "--basis" in args
+    if basis:
+        args.remove("--basis")
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    if len(args) != 2:
+        print("Использование: python main.py <входной файл> <выходной файл> [--basis]")
+        return False
 
-    graph = read_graph_from_file(input_file)
+    input_file = args[0]
+    output_file = args[1]
 
-    check_tree_properties(output_file, graph)
+    try:
+        graph = read_graph_from_file(input_file, cache)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка чтения {input_file}: {e}")
+        return False
+
+    try:
+        check_tree_properties(output_file, graph, basis)
+    except OSError as e:
+        print(f"Ошибка записи {output_file}: {e}")
+        return False
+    return True
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
@@ -1,3 +1,15 @@
+import os
+import sys
+import json
+import argparse
+
+try:
+    from diskretka import graphio, instrument
+except ImportError:  # см. diskretka/__init__.py
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from diskretka import graphio, instrument
+
+
 class Graph:
     # Конструктор: создаем граф с n вершинами
     def __init__(self, n):
@@ -9,43 +21,73 @@ class Graph:
         self.graph[i].append(j) # добавляем j в список соседей i
         self.graph[j].append(i) # добавляем i в список соседей j
 
-    def print_graph(self):
+    # Массовое добавление рёбер из последовательности пар (i, j)
+    def add_edges(self, pairs):
+        adj = self.graph
+        for i, j in pairs:
+            adj[i].append(j)
+            adj[j].append(i)
+
+    def print_graph(self, file=None):
         for i in range(self.n):
-            print(f"{i}: {self.graph[i]}")
+            print(f"{i}: {self.graph[i]}", file=file)
 
     # Метод получения соседей вершины
     def neighbors(self, v):
         return self.graph[v]
 
 
-def read_graph_from_file(filename):
-    with open(filename, "r") as file:
-        n = int(file.readline())  # читаем количество вершин
-        graph = Graph(n)  # создаём граф
+def read_graph_from_file(filename, verbose=False, cache=False):
+    n, values = graphio.read_edge_list(filename, cache=cache)  # файл разбирается целиком за один проход
+    graph = Graph(n)  # создаём граф
 
-        for line in file:
-            parts = line.split() # делим строку по пробелам: ["0", "1"]
-            i = int(parts[0])
-            j = int(parts[1])
-            graph.add_edge(i, j)  # добавляем ребро
+    numbers = iter(values)
+    graph.add_edges(zip(numbers, numbers))  # числа рёбер идут парами (i, j)
 
-        graph.print_graph()
+    if verbose:
+        graph.print_graph(file=sys.stderr)  # stdout занят результатами в JSON lines
 
     return graph
 
 def findMIS(graph):
+    with instrument.timer("mis.findMIS"):
+        return _findMIS(graph)
+
+
+# Стек, считающий добавления: используется только при включённой инструментации
+class _CountingStack(list):
+    __slots__ = ("pushes",)
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.pushes = 0
+
+    def append(self, item):
+        self.pushes += 1
+        super().append(item)
+
+
+# перебор с отсечениями; findMIS оборачивает его в таймер инструментации
+def _findMIS(graph):
     MIS = set()
     S = set()
     T = set(range(graph.n)) # все вершины
-    stack = [(S, T)] # стек с начальным состоянием
+    stats = instrument.enabled
+    stack = _CountingStack([(S, T)]) if stats else [(S, T)] # стек с начальным состоянием
+    improved = 0  # сколько раз нашли множество больше текущего (не больше n + 1 раз)
 
     while stack:
         S, T = stack.pop()
 
+        # даже взяв все оставшиеся вершины, не превзойдём найденное - отсекаем ветку
+        if len(S) + len(T) <= len(MIS):
+            continue
+
         # проверим, пусто ли T
         if not T:
             if len(S) > len(MIS):
                 MIS = S.copy()
+                improved += 1
         else:
             v = T.pop()
 
@@ -62,6 +104,14 @@ def findMIS(graph):
             # 2) Не берём v
             stack.append((S, T.copy()))
 
+    if stats:
+        # каждая снятая со стека вершина либо отсечена, либо улучшила MIS,
+        # либо раскрыта в две новые - отсюда число отсечений
+        explored = 1 + stack.pushes
+        expanded = stack.pushes // 2
+        instrument.count("mis.findMIS.explored", explored)
+        instrument.count("mis.findMIS.pruned", explored - expanded - improved)
+
     return MIS
 
 def findMVC_from_MIS(graph, MIS):
@@ -69,28 +119,92 @@ def findMVC_from_MIS(graph, MIS):
     return V - MIS
 
 
-def write_results_to_file(filename, graph, MIS, MVC):
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(f"вершины: {graph.n}\n")
-        edge_count = sum(len(neigh) for neigh in graph.graph) // 2
-        f.write(f"рёбра: {edge_count}\n")
-        f.write(f"размер наибольшего независимого множества: {len(MIS)}\n")
-        f.write(f"размер наименьшего вершинного покрытия: {len(MVC)}\n")
-        f.write(f"наибольшее независимое множество: {MIS}\n")
-        f.write(f"наименьшее вершинное покрытие: {MVC}\n")
-
-
-if __name__ == "__main__":
-    graph =  read_graph_from_file("input.txt")
+# Обработка одного файла: возвращает словарь с результатами для JSON-строки
+# (если файл не читается или испорчен - словарь с полем "error")
+def process_file(filename, verbose=False, cache=False):
+    try:
+        graph = read_graph_from_file(filename, verbose, cache)
+    except (OSError, ValueError) as e:
+        return {"file": filename, "error": str(e)}
 
     MIS = findMIS(graph)
     MVC = findMVC_from_MIS(graph, MIS)
 
-    print("\n=== Результаты анализа ===")
-    print(f"Наибольшее независимое множество (MIS): {MIS}")
-    print(f"Размер MIS: {len(MIS)}")
+    return {
+        "file": filename,
+        "vertices": graph.n,
+        "edges": sum(len(neigh) for neigh in graph.graph) // 2,
+        "mis_size": len(MIS),
+        "mvc_size": len(MVC),
+        "mis": sorted(MIS),
+        "mvc": sorted(MVC),
+    }
+
+
+# То же в процессе пула: счётчики воркера возвращаются родителю вместе с результатом
+def _process_file_in_worker(filename, verbose, cache, stats):
+    instrument.enable(stats)
+    instrument.reset()  # воркер переиспользуется: снимок только за этот файл
+    result = process_file(filename, verbose, cache)
+    return result, instrument.snapshot() if stats else None
+
+
+# Обработка списка файлов: результаты выдаются по одному в порядке файлов,
+# при jobs > 1 файлы раздаются пулу процессов
+def process_files(filenames, jobs=1, verbose=False, cache=False):
+    if jobs <= 1 or len(filenames) <= 1:
+        for name in filenames:
+            yield process_file(name, verbose, cache)
+        return
+
+    # пул нужен только для пакетной обработки - импортируем его лениво
+    from concurrent.futures import ProcessPoolExecutor
+
+    count = len(filenames)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result, snapshot in pool.map(_process_file_in_worker, filenames, [verbose] * count,
+                                         [cache] * count, [instrument.enabled] * count):
+            instrument.merge(snapshot)
+            yield result
+
+
+# Пишет каждую строку сразу, как только готов результат; ошибки дублируются в stderr.
+# Возвращает False, если хотя бы один файл обработать не удалось
+def write_results_jsonl(file, results):
+    ok = True
+    for result in results:
+        file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        file.flush()
+        if "error" in result:
+            print(f"Ошибка в файле {result['file']}: {result['error']}", file=sys.stderr)
+            ok = False
+    return ok
+
+
+def main(argv=None, cache=False):
+    parser = argparse.ArgumentParser(
+        description="Поиск наибольшего независимого множества и наименьшего вершинного покрытия")
+    parser.add_argument("inputs", nargs="+", help="входные файлы с графами")
+    parser.add_argument("-o", "--output", default="-",
+                        help="выходной файл JSON lines (по умолчанию stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="число процессов для обработки нескольких файлов")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="печатать списки смежности при загрузке")
+    args = parser.parse_args(argv)
+
+    results = process_files(args.inputs, args.jobs, args.verbose, cache)
+
+    if args.output == "-":
+        return write_results_jsonl(sys.stdout, results)
+
+    try:
+        with open(args.output, "w", encoding="utf-8") as f:
+            return write_results_jsonl(f, results)
+    except OSError as e:
+        print(f"Ошибка записи {args.output}: {e}", file=sys.stderr)
+        return False
 
-    print(f"\nНаименьшее вершинное покрытие (MVC): {MVC}")
-    print(f"Размер MVC: {len(MVC)}")
 
-    write_results_to_file("output.txt", graph, MIS, MVC)
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)